@@ -3,19 +3,29 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import hashlib
+import logging
+import math
+import os
+import queue
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Set, Tuple
 
+import numpy as np
+import orjson
 import pybullet as pb
 import pybullet_data
 import uvicorn
 import yaml
-from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 try:
     import xacro
@@ -24,6 +34,13 @@ except ImportError as exc:  # pragma: no cover
         "xacro is required. Install with `pip install xacro` or source ROS2."  # noqa: E501
     ) from exc
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_XACRO = ROOT / "urdf" / "hand.urdf.xacro"
 DEFAULT_LIMITS = ROOT / "config" / "joint_limits.yaml"
@@ -31,6 +48,18 @@ MOTION_DIR = ROOT / "config" / "motions"
 SAMPLE_URDF = ROOT / "urdf" / "sample_hand.urdf"
 DEFAULT_MODEL_SOURCE = "sample"
 
+SIM_TIME_STEP = 1.0 / 240.0
+PUBLISH_INTERVAL = 1.0 / 20.0
+# One stepSimulation call covers SIM_TIME_STEP of simulated time, so a 20 Hz
+# publish tick must run a batch of steps to keep the simulation at real time.
+STEPS_PER_TICK = max(1, int(PUBLISH_INTERVAL / SIM_TIME_STEP))
+MAX_STEPS_PER_TICK = STEPS_PER_TICK * 2
+
+# Broadcast only joints that moved by more than this since the last send, with
+# a periodic full snapshot so late joiners and drop-affected clients resync.
+DELTA_EPSILON = 1e-4
+SNAPSHOT_INTERVAL = 5.0
+
 app = FastAPI(title="Hand Simulator Backend")
 app.add_middleware(
     CORSMiddleware,
@@ -66,6 +95,57 @@ class MotionDefinition(BaseModel):
     keyframes: List[MotionKeyframe]
 
 
+# Precompiled validator: validates the whole nested structure in one call to
+# pydantic-core instead of one Python-level constructor per keyframe.
+_MOTION_ADAPTER = TypeAdapter(MotionDefinition)
+
+
+# Parsed YAML cache keyed by (path, mtime): motion and limit files are tiny
+# but YAML parsing is slow, and they are re-read on every motion trigger.
+_YAML_CACHE: Dict[Tuple[str, int], Dict] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+def _yaml_cached(path: Path) -> Dict:
+    key = (str(path), path.stat().st_mtime_ns)
+    with _YAML_CACHE_LOCK:
+        hit = _YAML_CACHE.get(key)
+    if hit is not None:
+        return hit
+    data = yaml.load(path.read_bytes(), Loader=_YamlLoader)
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[key] = data
+    return data
+
+
+# Rendered URDF cache keyed by (source, path, mtime). Xacro processing and XML
+# serialization are expensive, so warm hits skip the parse entirely; the mtime
+# key invalidates the entry whenever the file changes on disk.
+_URDF_CACHE: Dict[Tuple[str, str, float], str] = {}
+_URDF_CACHE_LOCK = threading.Lock()
+
+
+def _cached_render(source: str, path: Path, render: Callable[[Path], str]) -> str:
+    st = path.stat()
+    key = (source, str(path), st.st_mtime)
+    with _URDF_CACHE_LOCK:
+        hit = _URDF_CACHE.get(key)
+    if hit is not None:
+        return hit
+    xml = render(path)
+    with _URDF_CACHE_LOCK:
+        _URDF_CACHE[key] = xml
+    return xml
+
+
+def _read_sample(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def _process_xacro(path: Path) -> str:
+    return xacro.process_file(path).toxml()
+
+
 def render_urdf(source: str = "auto") -> str:
     if source not in {"auto", "sample", "xacro"}:
         raise RuntimeError(f"Unsupported URDF source '{source}'")
@@ -73,26 +153,62 @@ def render_urdf(source: str = "auto") -> str:
     if source == "sample":
         if not SAMPLE_URDF.exists():
             raise RuntimeError("Sample URDF not found")
-        return SAMPLE_URDF.read_text(encoding="utf-8")
+        return _cached_render(source, SAMPLE_URDF, _read_sample)
 
     if source == "xacro":
         if not DEFAULT_XACRO.exists():
             raise RuntimeError("Xacro source not found")
-        return xacro.process_file(DEFAULT_XACRO).toxml()
+        return _cached_render(source, DEFAULT_XACRO, _process_xacro)
 
     # auto mode
     if DEFAULT_XACRO.exists():
         try:
-            return xacro.process_file(DEFAULT_XACRO).toxml()
+            return _cached_render(source, DEFAULT_XACRO, _process_xacro)
         except Exception:  # pragma: no cover
             if SAMPLE_URDF.exists():
-                return SAMPLE_URDF.read_text(encoding="utf-8")
+                return _cached_render(source, SAMPLE_URDF, _read_sample)
             raise
     if SAMPLE_URDF.exists():
-        return SAMPLE_URDF.read_text(encoding="utf-8")
+        return _cached_render(source, SAMPLE_URDF, _read_sample)
     raise RuntimeError("No URDF source available")
 
 
+def _clear_urdf_cache() -> None:
+    with _URDF_CACHE_LOCK:
+        _URDF_CACHE.clear()
+
+
+render_urdf.cache_clear = _clear_urdf_cache  # type: ignore[attr-defined]
+
+# On-disk cache of rendered URDFs, named by content hash so identical XML maps
+# to the same file across Simulation constructions and across processes.
+_URDF_FILE_CACHE_DIR = Path(tempfile.gettempdir()) / "hand_simulator_urdf"
+_URDF_FILE_MAX_AGE = 7 * 24 * 3600.0
+
+
+def _urdf_cache_path(xml: str, digest: str | None = None) -> Path:
+    _URDF_FILE_CACHE_DIR.mkdir(exist_ok=True)
+    if digest is None:
+        digest = hashlib.sha1(xml.encode("utf-8")).hexdigest()[:16]
+    path = _URDF_FILE_CACHE_DIR / f"hand_{digest}.urdf"
+    if not path.exists():
+        path.write_text(xml, encoding="utf-8")
+    return path
+
+
+@atexit.register
+def _prune_urdf_file_cache() -> None:  # pragma: no cover
+    if not _URDF_FILE_CACHE_DIR.exists():
+        return
+    cutoff = time.time() - _URDF_FILE_MAX_AGE
+    for entry in _URDF_FILE_CACHE_DIR.glob("hand_*.urdf"):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+
+
 class Simulation:
     def __init__(self, xacro_file: Path, limits_file: Path, urdf_source: str = "auto") -> None:
         self.xacro_file = xacro_file
@@ -101,21 +217,66 @@ class Simulation:
         self.physics_client = pb.connect(pb.DIRECT)
         pb.setAdditionalSearchPath(pybullet_data.getDataPath())
         pb.setGravity(0, 0, -9.81)
+        # Stepping is driven manually, so realtime mode stays off; the default
+        # 50 solver iterations are overkill for a small fixed-base hand, and
+        # the unused contact features just cost per-step CPU.
+        pb.setRealTimeSimulation(0)
+        pb.setPhysicsEngineParameter(
+            fixedTimeStep=SIM_TIME_STEP,
+            numSolverIterations=15,
+            numSubSteps=1,
+            enableConeFriction=0,
+            deterministicOverlappingPairs=1,
+            useSplitImpulse=0,
+        )
         pb.loadURDF("plane.urdf")
         self.hand_id = self._load_hand()
-        self.joint_map = self._build_joint_map()
+        self._rebuild_joint_buffers()
 
     def _load_limits(self, path: Path) -> Dict[str, Dict[str, float]]:
-        with path.open("r", encoding="utf-8") as stream:
-            data = yaml.safe_load(stream)
-        return data.get("limits", {})
+        return _yaml_cached(path).get("limits", {})
 
     def _load_hand(self) -> int:
         xml = render_urdf(self.urdf_source)
-        tmp = tempfile.NamedTemporaryFile("w", suffix=".urdf", delete=False)
-        tmp.write(xml)
-        tmp.close()
-        return pb.loadURDF(tmp.name, useFixedBase=True)
+        # render_urdf and the file cache are both content/mtime keyed, so an
+        # unchanged hand costs one hash here, no xacro parse and no write.
+        # URDF_MAINTAIN_LINK_ORDER keeps joint indices identical across
+        # reloads of the same file, so a cached joint map stays valid.
+        digest = hashlib.sha1(xml.encode("utf-8")).hexdigest()[:16]
+        body = pb.loadURDF(
+            str(_urdf_cache_path(xml, digest)),
+            useFixedBase=True,
+            flags=pb.URDF_USE_INERTIA_FROM_FILE | pb.URDF_MAINTAIN_LINK_ORDER,
+        )
+        # Record only after a successful load so a failed reload cannot
+        # poison the unchanged-content comparison.
+        self._hand_digest = digest
+        return body
+
+    def _rebuild_joint_buffers(self) -> None:
+        self.joint_map = self._build_joint_map()
+        self._joint_names: List[str] = list(self.joint_map.keys())
+        self._joint_indices: List[int] = list(self.joint_map.values())
+        # Preallocated SoA state buffer: one contiguous float array instead of
+        # a dict of boxed floats rebuilt every tick.
+        self._state_buf = np.empty(len(self._joint_indices), dtype=np.float32)
+
+    def reload_hand(self) -> None:
+        """Swap the hand body in place, keeping the physics client and plane.
+
+        Reconstructing the whole Simulation reconnects to PyBullet and reloads
+        plane.urdf; replacing just the hand body skips both, and the joint
+        buffers are only rebuilt when the URDF content actually changed. The
+        new body is loaded before the old one is removed, so a malformed URDF
+        raises here with the current hand still intact.
+        """
+        old_id = self.hand_id
+        old_digest = self._hand_digest
+        new_id = self._load_hand()
+        pb.removeBody(old_id)
+        self.hand_id = new_id
+        if self._hand_digest != old_digest:
+            self._rebuild_joint_buffers()
 
     def _build_joint_map(self) -> Dict[str, int]:
         mapping: Dict[str, int] = {}
@@ -127,55 +288,332 @@ class Simulation:
         return mapping
 
     def get_joint_state(self) -> Dict[str, float]:
-        state = {}
-        for name, idx in self.joint_map.items():
-            pos, vel, _, _ = pb.getJointState(self.hand_id, idx)
-            state[name] = pos
-        return state
+        return dict(zip(self._joint_names, self.get_joint_state_array().tolist()))
+
+    def get_joint_state_array(self) -> np.ndarray:
+        """Fill and return the shared state buffer; callers must copy to keep it."""
+        # Batched query: one C call instead of one per joint.
+        states = pb.getJointStates(self.hand_id, self._joint_indices)
+        for i, state in enumerate(states):
+            self._state_buf[i] = state[0]
+        return self._state_buf
 
     def apply_targets(self, targets: Dict[str, float], max_force: float) -> None:
+        indices = []
+        positions = []
         for name, value in targets.items():
             idx = self.joint_map.get(name)
             if idx is None:
                 continue
-            pb.setJointMotorControl2(
-                bodyIndex=self.hand_id,
-                jointIndex=idx,
-                controlMode=pb.POSITION_CONTROL,
-                targetPosition=value,
-                force=max_force,
+            indices.append(idx)
+            positions.append(value)
+        if not indices:
+            return
+        pb.setJointMotorControlArray(
+            self.hand_id,
+            indices,
+            pb.POSITION_CONTROL,
+            targetPositions=positions,
+            forces=[max_force] * len(indices),
+        )
+
+    @property
+    def joint_names(self) -> List[str]:
+        return self._joint_names
+
+    def step_batch(self, count: int) -> None:
+        for _ in range(count):
+            pb.stepSimulation(physicsClientId=self.physics_client)
+
+
+class SimWorker(threading.Thread):
+    """Owns the PyBullet client on a dedicated thread.
+
+    PyBullet calls block for the duration of the C step, so issuing them from
+    the asyncio event loop stalls HTTP handlers and WebSocket sends while
+    physics runs. The worker constructs the Simulation on its own thread
+    (PyBullet expects calls from the connecting thread), drives the step loop
+    itself, applies queued joint commands, and refreshes a lock-protected
+    snapshot of the joint state for the async side to read without blocking.
+    """
+
+    def __init__(self, xacro_file: Path, limits_file: Path, urdf_source: str) -> None:
+        super().__init__(name="sim-worker", daemon=True)
+        self._xacro_file = xacro_file
+        self._limits_file = limits_file
+        self._urdf_source = urdf_source
+        self._commands: queue.Queue[Tuple[Dict[str, float], float]] = queue.Queue()
+        self._state_lock = threading.Lock()
+        self._latest_state = np.empty(0, dtype=np.float32)
+        self._reload_requested = threading.Event()
+        # Bumped whenever a reload changes the joint set; the publisher
+        # compares it each tick and resyncs connected clients.
+        self._schema_version = 0
+        self._last_reload_error: str | None = None
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._startup_error: BaseException | None = None
+        self.simulation: Simulation | None = None
+
+    def run(self) -> None:
+        try:
+            self.simulation = Simulation(
+                self._xacro_file, self._limits_file, urdf_source=self._urdf_source
             )
+        except BaseException as exc:  # pragma: no cover
+            self._startup_error = exc
+            self._ready.set()
+            return
+        with self._state_lock:
+            self._latest_state = self.simulation.get_joint_state_array().copy()
+        self._ready.set()
+        last_tick = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                while True:
+                    try:
+                        targets, max_force = self._commands.get_nowait()
+                    except queue.Empty:
+                        break
+                    self.simulation.apply_targets(targets, max_force)
+                if self._reload_requested.is_set():
+                    # Reloads must run here: PyBullet calls belong to this
+                    # thread.
+                    self._reload_requested.clear()
+                    self._reload_hand()
+                now = time.monotonic()
+                steps = min(
+                    MAX_STEPS_PER_TICK,
+                    max(1, math.ceil((now - last_tick) / SIM_TIME_STEP)),
+                )
+                last_tick = now
+                self.simulation.step_batch(steps)
+                with self._state_lock:
+                    self._latest_state = (
+                        self.simulation.get_joint_state_array().copy()
+                    )
+            except Exception:  # pragma: no cover
+                # A bad tick must not kill the worker: the thread dying would
+                # silently halt physics and freeze /state on the last snapshot.
+                logger.exception("simulation worker tick failed")
+            self._stop.wait(PUBLISH_INTERVAL)
+
+    def _reload_hand(self) -> None:
+        assert self.simulation is not None
+        old_names = list(self.simulation.joint_names)
+        try:
+            self.simulation.reload_hand()
+        except Exception as exc:
+            # reload_hand swaps only on success, so the previous hand is
+            # still simulating; record the failure for /urdf/reload/status.
+            self._last_reload_error = str(exc)
+            logger.exception("hand reload failed; keeping previous model")
+            return
+        self._last_reload_error = None
+        if self.simulation.joint_names != old_names:
+            _invalidate_schema_payload()
+            self._schema_version += 1
+
+    def wait_ready(self) -> None:
+        self._ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
+
+    @property
+    def limits(self) -> Dict[str, Dict[str, float]]:
+        assert self.simulation is not None
+        return self.simulation.limits
+
+    @property
+    def joint_names(self) -> List[str]:
+        assert self.simulation is not None
+        return self.simulation.joint_names
+
+    def apply_targets(self, targets: Dict[str, float], max_force: float = 5.0) -> None:
+        self._commands.put((dict(targets), max_force))
 
-    def step(self, time_step: float = 1.0 / 240.0) -> None:
-        pb.stepSimulation()
+    def get_joint_state(self) -> Dict[str, float]:
+        return dict(zip(self.joint_names, self.get_joint_state_array().tolist()))
 
+    def get_joint_state_array(self) -> np.ndarray:
+        with self._state_lock:
+            return self._latest_state.copy()
 
-simulation = Simulation(DEFAULT_XACRO, DEFAULT_LIMITS, urdf_source=DEFAULT_MODEL_SOURCE)
-state_subscribers: List[WebSocket] = []
-state_publish_task: asyncio.Task | None = None
+    def request_reload(self) -> None:
+        self._reload_requested.set()
 
+    @property
+    def schema_version(self) -> int:
+        return self._schema_version
 
-async def ensure_state_publisher() -> None:
-    global state_publish_task
-    if state_publish_task and not state_publish_task.done():
-        return
+    @property
+    def last_reload_error(self) -> str | None:
+        return self._last_reload_error
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+sim_worker = SimWorker(DEFAULT_XACRO, DEFAULT_LIMITS, urdf_source=DEFAULT_MODEL_SOURCE)
+sim_worker.start()
+sim_worker.wait_ready()
+
+
+class Subscriber:
+    """A connected /ws/state client with its own bounded send queue.
+
+    The publisher only enqueues payloads; a dedicated sender task per client
+    awaits the socket, so one slow consumer cannot stall the broadcast for
+    everyone else.
+    """
 
-    async def publisher() -> None:
+    def __init__(self, ws: WebSocket) -> None:
+        self.ws = ws
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=2)
+        self.task = asyncio.create_task(self._sender())
+
+    async def _sender(self) -> None:
         try:
             while True:
-                state = simulation.get_joint_state()
-                message = {"type": "state", "joints": state}
-                for ws in list(state_subscribers):
-                    try:
-                        await ws.send_json(message)
-                    except Exception:
-                        state_subscribers.remove(ws)
-                simulation.step()
-                await asyncio.sleep(1.0 / 20.0)
-        except asyncio.CancelledError:  # pragma: no cover
+                payload = await self.queue.get()
+                await self.ws.send_bytes(payload)
+        except Exception:
+            # The socket went away mid-send; the publisher prunes this
+            # subscriber on its next tick.
             pass
 
-    state_publish_task = asyncio.create_task(publisher())
+    def offer(self, payload: bytes) -> None:
+        # Latest-wins back-pressure: drop the oldest queued frame for a slow
+        # client rather than blocking the publisher.
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:  # pragma: no cover
+                pass
+            self.queue.put_nowait(payload)
+
+    def resync(self, schema: bytes, snapshot: bytes) -> None:
+        # Frames queued under the old schema would be misapplied; drop them,
+        # then enqueue the new schema followed by a full snapshot (exactly
+        # fills the queue, so neither can displace the other).
+        while True:
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        self.queue.put_nowait(schema)
+        self.queue.put_nowait(snapshot)
+
+    def close(self) -> None:
+        if self.task.done():
+            # Retrieve any exception so asyncio does not log
+            # "Task exception was never retrieved" for dropped clients.
+            if not self.task.cancelled():
+                self.task.exception()
+        else:
+            self.task.cancel()
+
+
+state_subscribers: Set[Subscriber] = set()
+
+# Poll interval while nobody is connected; the publisher idles instead of
+# encoding and diffing state for zero clients.
+IDLE_POLL_INTERVAL = 0.25
+
+
+async def state_publisher() -> None:
+    loop = asyncio.get_running_loop()
+    last_sent: np.ndarray | None = None
+    next_snapshot = 0.0
+    schema_version = sim_worker.schema_version
+    try:
+        while True:
+            if not state_subscribers:
+                await asyncio.sleep(IDLE_POLL_INTERVAL)
+                continue
+            # Stepping happens on the sim worker thread; this loop only
+            # snapshots the latest state and fans it out. Joint names
+            # travel once per connection in the schema message, so frames
+            # carry only float values in schema order: a full "state"
+            # array every SNAPSHOT_INTERVAL, and in between a "delta" of
+            # (index, value) pairs for joints that actually moved.
+            state = sim_worker.get_joint_state_array()
+            now = loop.time()
+            if sim_worker.schema_version != schema_version:
+                # A reload changed the joint set: positional frames under the
+                # old schema would be applied to the wrong joints, so every
+                # connected client gets the new schema followed by a full
+                # snapshot before any further state/delta frames.
+                schema_version = sim_worker.schema_version
+                snapshot = orjson.dumps(
+                    {"type": "state", "v": state},
+                    option=orjson.OPT_SERIALIZE_NUMPY,
+                )
+                last_sent = state
+                next_snapshot = now + SNAPSHOT_INTERVAL
+                schema = _encoded_schema()
+                dead = []
+                for subscriber in list(state_subscribers):
+                    if subscriber.task.done():
+                        subscriber.close()
+                        dead.append(subscriber)
+                        continue
+                    subscriber.resync(schema, snapshot)
+                if dead:
+                    state_subscribers.difference_update(dead)
+                await asyncio.sleep(PUBLISH_INTERVAL)
+                continue
+            # A shape change without a version bump can only be a transient
+            # read between the worker's reload and its next state snapshot;
+            # force a snapshot so the delta compare never sees mixed shapes.
+            if last_sent is None or state.shape != last_sent.shape or now >= next_snapshot:
+                payload = orjson.dumps(
+                    {"type": "state", "v": state},
+                    option=orjson.OPT_SERIALIZE_NUMPY,
+                )
+                last_sent = state
+                next_snapshot = now + SNAPSHOT_INTERVAL
+            else:
+                changed = np.nonzero(np.abs(state - last_sent) > DELTA_EPSILON)[0]
+                if changed.size == 0:
+                    await asyncio.sleep(PUBLISH_INTERVAL)
+                    continue
+                last_sent[changed] = state[changed]
+                payload = orjson.dumps(
+                    {"type": "delta", "i": changed, "v": state[changed]},
+                    option=orjson.OPT_SERIALIZE_NUMPY,
+                )
+            # Encode once, then hand the same bytes to every subscriber's
+            # queue; the per-client sender tasks do the actual socket I/O.
+            # Dead subscribers are collected and dropped in one set-diff
+            # instead of per-element removal mid-iteration.
+            dead: List[Subscriber] = []
+            for subscriber in list(state_subscribers):
+                if subscriber.task.done():
+                    subscriber.close()
+                    dead.append(subscriber)
+                    continue
+                subscriber.offer(payload)
+            if dead:
+                state_subscribers.difference_update(dead)
+            await asyncio.sleep(PUBLISH_INTERVAL)
+    except asyncio.CancelledError:  # pragma: no cover
+        pass
+
+
+@app.on_event("startup")
+async def start_state_publisher() -> None:
+    app.state.publisher_task = asyncio.create_task(state_publisher())
+
+
+@app.on_event("shutdown")
+async def stop_state_publisher() -> None:
+    task = getattr(app.state, "publisher_task", None)
+    if task is not None:
+        task.cancel()
+    sim_worker.stop()
 
 
 @app.get("/")
@@ -192,56 +630,91 @@ async def get_urdf(source: str = Query("auto", pattern="^(auto|sample|xacro)$"))
     return Response(content=xml, media_type="application/xml")
 
 
+@app.post("/urdf/reload")
+async def reload_urdf() -> Dict[str, str]:
+    sim_worker.request_reload()
+    return {"status": "reloading"}
+
+
+@app.get("/urdf/reload/status")
+async def reload_urdf_status() -> Dict[str, str]:
+    error = sim_worker.last_reload_error
+    if error is not None:
+        return {"status": "error", "detail": error}
+    return {"status": "ok"}
+
+
 @app.get("/joints")
 async def list_joints() -> Dict[str, Dict[str, float]]:
-    return simulation.limits
+    return sim_worker.limits
 
 
 @app.post("/joints/command")
-async def command_joints(cmd: JointCommand, background: BackgroundTasks) -> Dict[str, str]:
-    simulation.apply_targets(cmd.targets, cmd.max_force)
-    background.add_task(simulation.step)
+async def command_joints(cmd: JointCommand) -> Dict[str, str]:
+    sim_worker.apply_targets(cmd.targets, cmd.max_force)
     return {"status": "queued"}
 
 
 @app.get("/state")
 async def get_state() -> Dict[str, float]:
-    return simulation.get_joint_state()
+    return sim_worker.get_joint_state()
+
+
+_MOTION_CACHE: Dict[Tuple[str, int], MotionDefinition] = {}
 
 
 def load_motion(name: str) -> MotionDefinition:
     motion_path = MOTION_DIR / f"{name}.yaml"
     if not motion_path.exists():
         raise HTTPException(status_code=404, detail="Motion not found")
-    with motion_path.open("r", encoding="utf-8") as stream:
-        data = yaml.safe_load(stream)
-    return MotionDefinition(**data)
+    # Cache the validated model too, so a warm trigger skips both the YAML
+    # parse and the Pydantic validation.
+    key = (str(motion_path), motion_path.stat().st_mtime_ns)
+    motion = _MOTION_CACHE.get(key)
+    if motion is None:
+        motion = _MOTION_ADAPTER.validate_python(_yaml_cached(motion_path))
+        _MOTION_CACHE[key] = motion
+    return motion
 
 
 async def play_motion(motion: MotionDefinition, scale: float = 1.0) -> None:
     if not motion.keyframes:
         return
-    total_time = motion.keyframes[-1].time * scale
-    start = asyncio.get_running_loop().time()
-    idx = 0
-    while idx < len(motion.keyframes):
-        now = asyncio.get_running_loop().time()
-        elapsed = now - start
-        frame = motion.keyframes[idx]
+    # Sleep straight through to each keyframe instead of polling at the motion
+    # frequency; the sim worker keeps stepping in between, so one wakeup per
+    # keyframe is all this coroutine needs.
+    frames = sorted(motion.keyframes, key=lambda frame: frame.time)
+    elapsed = 0.0
+    for frame in frames:
         target_time = frame.time * scale
-        if elapsed >= target_time:
-            simulation.apply_targets(frame.joints, max_force=5.0)
-            idx += 1
-        simulation.step()
-        await asyncio.sleep(1.0 / motion.frequency)
-    remaining = total_time - (asyncio.get_running_loop().time() - start)
-    if remaining > 0:
-        await asyncio.sleep(remaining)
+        if target_time > elapsed:
+            await asyncio.sleep(target_time - elapsed)
+            elapsed = target_time
+        sim_worker.apply_targets(frame.joints, max_force=5.0)
+    # No trailing sleep needed: elapsed ends at the last keyframe's scaled
+    # time, so the loop already covers the motion's full duration.
+
+
+_motions_cache: Tuple[int, List[str]] | None = None
 
 
 @app.get("/motions")
 async def list_motions() -> List[str]:
-    return [path.stem for path in MOTION_DIR.glob("*.yaml")]
+    global _motions_cache
+    # Rescan only when the directory mtime changes; warm calls are a tuple
+    # compare. os.scandir avoids the per-entry stat and Path allocation of
+    # Path.glob.
+    mtime = MOTION_DIR.stat().st_mtime_ns
+    if _motions_cache is not None and _motions_cache[0] == mtime:
+        return _motions_cache[1]
+    with os.scandir(MOTION_DIR) as entries:
+        names = sorted(
+            entry.name[: -len(".yaml")]
+            for entry in entries
+            if entry.name.endswith(".yaml")
+        )
+    _motions_cache = (mtime, names)
+    return names
 
 
 @app.post("/motions/play")
@@ -251,18 +724,73 @@ async def trigger_motion(req: MotionRequest) -> Dict[str, str]:
     return {"status": "playing"}
 
 
+_schema_payload: bytes | None = None
+
+
+def _invalidate_schema_payload() -> None:
+    global _schema_payload
+    _schema_payload = None
+
+
+def _encoded_schema() -> bytes:
+    # Joint names are fixed for the process lifetime, so the schema message is
+    # encoded exactly once and the same bytes are sent to every connection.
+    global _schema_payload
+    if _schema_payload is None:
+        _schema_payload = orjson.dumps(
+            {"type": "schema", "names": sim_worker.joint_names}
+        )
+    return _schema_payload
+
+
 @app.websocket("/ws/state")
 async def websocket_state(ws: WebSocket) -> None:
     await ws.accept()
-    state_subscribers.append(ws)
-    await ensure_state_publisher()
+    # One-time schema plus an immediate full snapshot so the client does not
+    # wait for the next periodic one; sent directly (not through the bounded
+    # queue) so they can never be dropped. A client bailing right after the
+    # handshake is routine, not worth a traceback.
+    try:
+        await ws.send_bytes(_encoded_schema())
+        await ws.send_bytes(
+            orjson.dumps(
+                {"type": "state", "v": sim_worker.get_joint_state_array()},
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            )
+        )
+    except Exception:
+        return
+    subscriber = Subscriber(ws)
+    state_subscribers.add(subscriber)
     try:
         while True:
             await ws.receive_text()
     except WebSocketDisconnect:
-        if ws in state_subscribers:
-            state_subscribers.remove(ws)
+        pass
+    finally:
+        state_subscribers.discard(subscriber)
+        subscriber.close()
 
 
 if __name__ == "__main__":  # pragma: no cover
-    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, reload=True)
+    # Prefer the C implementations (uvloop/httptools/websockets, all shipped
+    # by `uvicorn[standard]`) for the WS-broadcast-heavy workload; fall back
+    # to uvicorn's auto-detection when they are not installed.
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        loop_impl, http_impl, ws_impl = "auto", "auto", "auto"
+    else:
+        loop_impl, http_impl, ws_impl = "uvloop", "httptools", "websockets"
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop=loop_impl,
+        http=http_impl,
+        ws=ws_impl,
+        # State frames are already compact (schema-id encoding); skip the
+        # per-message deflate CPU cost.
+        ws_per_message_deflate=False,
+    )
@@ -64,6 +64,8 @@ let currentRobot = null;
 let jointLimits = {};
 let jointInputs = {};
 let ws = null;
+let wsJointNames = [];
+const wsDecoder = new TextDecoder();
 
 function appendLog(message) {
   const line = document.createElement("div");
@@ -220,11 +222,25 @@ async function playSelectedMotion() {
   appendLog(`Playing motion: ${name}`);
 }
 
+function applyJointValue(name, value) {
+  if (!name) {
+    return;
+  }
+  const input = jointInputs[name];
+  if (input && document.activeElement !== input) {
+    input.value = value.toFixed(3);
+  }
+  if (currentRobot && currentRobot.joints && currentRobot.joints[name]) {
+    currentRobot.joints[name].setJointValue(value);
+  }
+}
+
 function connectWebSocket() {
   if (ws) {
     ws.close();
   }
   ws = new WebSocket(wsUrl);
+  ws.binaryType = "arraybuffer";
   wsStatus.textContent = "connecting";
 
   ws.addEventListener("open", () => {
@@ -233,17 +249,19 @@ function connectWebSocket() {
   });
 
   ws.addEventListener("message", (event) => {
-    const data = JSON.parse(event.data);
-    if (data.type === "state") {
-      const joints = data.joints;
-      Object.entries(joints).forEach(([name, value]) => {
-        const input = jointInputs[name];
-        if (input && document.activeElement !== input) {
-          input.value = value.toFixed(3);
-        }
-        if (currentRobot && currentRobot.joints && currentRobot.joints[name]) {
-          currentRobot.joints[name].setJointValue(value);
-        }
+    const text = typeof event.data === "string" ? event.data : wsDecoder.decode(event.data);
+    const data = JSON.parse(text);
+    if (data.type === "schema") {
+      wsJointNames = data.names;
+    } else if (data.type === "state") {
+      // Full snapshot: values positional in schema order.
+      data.v.forEach((value, i) => {
+        applyJointValue(wsJointNames[i], value);
+      });
+    } else if (data.type === "delta") {
+      // Only joints that moved, as parallel index/value arrays.
+      data.i.forEach((jointIndex, k) => {
+        applyJointValue(wsJointNames[jointIndex], data.v[k]);
       });
     }
   });
@@ -281,7 +299,9 @@ playMotionBtn.addEventListener("click", () => {
 });
 
 reloadButton.addEventListener("click", () => {
-  loadURDF().catch((err) => appendLog(err.message));
+  postJSON("/urdf/reload", {})
+    .then(() => loadURDF())
+    .catch((err) => appendLog(err.message));
 });
 
 resetButton.addEventListener("click", () => {